@@ -1,12 +1,15 @@
 import asyncio
+import hashlib
 import json
 import logging
-import re
 import time
 import typing as T
+from collections import OrderedDict
 
+import httpx
+import numpy as np
 import openai
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from llm import LLM, LLMConfig, get_llm_class
 from providers.avatar_llm_state_provider import AvatarLLMState
@@ -14,6 +17,93 @@ from providers.llm_history_manager import LLMHistoryManager
 
 R = T.TypeVar("R", bound=BaseModel)
 
+_eval_client_singleton: T.Optional[openai.AsyncClient] = None
+
+_llm_class_cache: T.Dict[str, T.Type[LLM]] = {}
+
+_EVAL_TEMPLATE = """You are evaluating two AI responses to determine which better answers the user's question.
+
+Original User Question/Context:
+{q}
+
+Response A (local model):
+{a}
+
+Response B (cloud model):
+{b}
+
+Evaluate based on:
+1. Relevance - Which response better addresses the user's question?
+2. Completeness - Does it fully answer what was asked?
+3. Appropriateness - Are the actions suitable for the context?
+4. Quality - Is the content natural and engaging?
+
+Respond with ONLY a single word: either "A" or "B" for the better response."""
+
+
+def _get_llm_class(class_name: str) -> T.Type[LLM]:
+    """
+    Resolve an LLM class by name, memoizing the plugin-directory scan.
+
+    Parameters
+    ----------
+    class_name : str
+        The exact class name.
+
+    Returns
+    -------
+    T.Type[LLM]
+        The resolved LLM class.
+    """
+    llm_class = _llm_class_cache.get(class_name)
+    if llm_class is None:
+        llm_class = get_llm_class(class_name)
+        _llm_class_cache[class_name] = llm_class
+    return llm_class
+
+
+def _get_eval_client() -> openai.AsyncClient:
+    """
+    Return the process-wide eval client, creating it on first use.
+
+    The client is backed by a shared httpx connection pool with
+    keep-alive enabled, so repeated judge/history calls reuse warm
+    connections instead of paying connection setup per call.
+
+    Returns
+    -------
+    openai.AsyncClient
+        Shared client pointed at the local eval endpoint.
+    """
+    global _eval_client_singleton
+    if _eval_client_singleton is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=16,
+                keepalive_expiry=60,
+            ),
+            timeout=httpx.Timeout(2.0),
+        )
+        _eval_client_singleton = openai.AsyncClient(
+            base_url="http://127.0.0.1:8000/v1",
+            api_key="local",
+            http_client=http_client,
+        )
+    return _eval_client_singleton
+
+
+async def _reap_tasks(tasks: T.List[asyncio.Task]) -> None:
+    """
+    Await cancelled tasks so their CancelledError is retrieved.
+
+    Parameters
+    ----------
+    tasks : list of asyncio.Task
+        Tasks that have been cancelled and need reaping.
+    """
+    await asyncio.gather(*tasks, return_exceptions=True)
+
 
 def _extract_voice_input(prompt: str) -> str:
     """
@@ -29,10 +119,17 @@ def _extract_voice_input(prompt: str) -> str:
     str
         Extracted voice input text, or empty string if not found.
     """
-    match = re.search(r"INPUT: Voice\s*// START\s*(.*?)\s*// END", prompt, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return ""
+    start = prompt.find("INPUT: Voice")
+    if start < 0:
+        return ""
+    start = prompt.find("// START", start)
+    if start < 0:
+        return ""
+    start += len("// START")
+    end = prompt.find("// END", start)
+    if end < 0:
+        return ""
+    return prompt[start:end].strip()
 
 
 class DualLLMConfig(LLMConfig):
@@ -49,6 +146,12 @@ class DualLLMConfig(LLMConfig):
         Class name of the cloud LLM (default: "OpenAILLM").
     cloud_llm_config : dict
         Configuration for the cloud LLM.
+    local_fastpath_threshold : float
+        Seconds under which a local function-calling response wins
+        outright without waiting for the cloud LLM (0 disables).
+    embedding_model : str, optional
+        Embedding model served by the local eval endpoint, used for the
+        semantic cache tier. Unset disables the semantic tier.
     """
 
     local_llm_type: str = Field(
@@ -65,6 +168,22 @@ class DualLLMConfig(LLMConfig):
         default_factory=lambda: {"model": "gpt-4.1"},
         description="Configuration for the cloud LLM",
     )
+    local_fastpath_threshold: float = Field(
+        default=0.8,
+        description=(
+            "Seconds under which a local function-calling response wins "
+            "outright without waiting for the cloud LLM (0 disables)"
+        ),
+    )
+    embedding_model: T.Optional[str] = Field(
+        default=None,
+        description=(
+            "Embedding model for the semantic cache tier; "
+            "the tier is disabled when unset"
+        ),
+    )
+
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class DualLLM(LLM[R]):
@@ -94,6 +213,8 @@ class DualLLM(LLM[R]):
     """
 
     TIMEOUT_THRESHOLD = 3.2
+    CACHE_CAPACITY = 1024
+    SEMANTIC_THRESHOLD = 0.95
 
     def __init__(
         self,
@@ -118,34 +239,160 @@ class DualLLM(LLM[R]):
         self._config: DualLLMConfig
 
         local_type = self._config.local_llm_type
-        local_cfg = self._config.local_llm_config.copy()
+        local_cfg = self._config.local_llm_config
         cloud_type = self._config.cloud_llm_type
-        cloud_cfg = self._config.cloud_llm_config.copy()
-
-        cloud_cfg["api_key"] = self._config.api_key
+        cloud_cfg = {**self._config.cloud_llm_config, "api_key": self._config.api_key}
 
-        LocalLLMClass = get_llm_class(local_type)
-        CloudLLMClass = get_llm_class(cloud_type)
+        self._local_llm_spec = (_get_llm_class(local_type), LLMConfig(**local_cfg))
+        self._cloud_llm_spec = (_get_llm_class(cloud_type), LLMConfig(**cloud_cfg))
 
-        self._local_llm: LLM = LocalLLMClass(
-            config=LLMConfig(**local_cfg), available_actions=available_actions
-        )
-        self._cloud_llm: LLM = CloudLLMClass(
-            config=LLMConfig(**cloud_cfg), available_actions=available_actions
-        )
+        self._local_llm: T.Optional[LLM] = None
+        self._cloud_llm: T.Optional[LLM] = None
 
-        self._local_llm._skip_state_management = True
-        self._cloud_llm._skip_state_management = True
+        self._local_fastpath = self._config.local_fastpath_threshold
 
-        self._eval_client = openai.AsyncClient(
-            base_url="http://127.0.0.1:8000/v1", api_key="local"
-        )
+        self._eval_client = _get_eval_client()
         self._eval_model = local_cfg.get(
             "model", "RedHatAI/Qwen3-30B-A3B-quantized.w4a16"
         )
+        self._embedding_model = self._config.embedding_model
 
         self.history_manager = LLMHistoryManager(self._config, self._eval_client)
 
+        self._exact_cache: "OrderedDict[bytes, R]" = OrderedDict()
+        self._semantic_embeddings: T.Optional[np.ndarray] = None
+        self._semantic_results: T.List[R] = []
+
+    def _ensure_llms(self) -> T.Tuple[LLM, LLM]:
+        """
+        Construct the local and cloud LLMs on first use.
+
+        Deferring construction keeps DualLLM instantiation cheap and
+        avoids setting up networking clients for turns that are served
+        from the cache.
+
+        Returns
+        -------
+        tuple of LLM
+            The (local, cloud) LLM instances.
+        """
+        if self._local_llm is None:
+            LocalLLMClass, local_config = self._local_llm_spec
+            self._local_llm = LocalLLMClass(
+                config=local_config, available_actions=self._available_actions
+            )
+            self._local_llm._skip_state_management = True
+        if self._cloud_llm is None:
+            CloudLLMClass, cloud_config = self._cloud_llm_spec
+            self._cloud_llm = CloudLLMClass(
+                config=cloud_config, available_actions=self._available_actions
+            )
+            self._cloud_llm._skip_state_management = True
+        return self._local_llm, self._cloud_llm
+
+    @staticmethod
+    def _cache_key(prompt: str) -> bytes:
+        """
+        Compute the exact-cache key for a prompt.
+
+        Parameters
+        ----------
+        prompt : str
+            The full prompt text.
+
+        Returns
+        -------
+        bytes
+            16-byte blake2b digest of the prompt.
+        """
+        return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+    async def _embed_prompt(self, prompt: str) -> T.Optional[np.ndarray]:
+        """
+        Embed a prompt for the semantic cache tier.
+
+        Parameters
+        ----------
+        prompt : str
+            The full prompt text.
+
+        Returns
+        -------
+        np.ndarray or None
+            L2-normalized embedding vector, or None if the semantic tier
+            is disabled or the embedding endpoint is unavailable.
+        """
+        if self._embedding_model is None:
+            return None
+        try:
+            response = await self._eval_client.embeddings.create(
+                model=self._embedding_model, input=prompt, timeout=1.0
+            )
+            vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm == 0:
+                return None
+            return vector / norm
+        except Exception as e:
+            logging.debug(f"Prompt embedding unavailable, skipping semantic cache: {e}")
+            return None
+
+    def _semantic_lookup(self, embedding: T.Optional[np.ndarray]) -> R | None:
+        """
+        Find a cached response for a near-duplicate prompt.
+
+        Parameters
+        ----------
+        embedding : np.ndarray or None
+            L2-normalized query embedding.
+
+        Returns
+        -------
+        R or None
+            Cached response whose prompt embedding has cosine similarity
+            >= SEMANTIC_THRESHOLD, or None on miss.
+        """
+        if embedding is None or self._semantic_embeddings is None:
+            return None
+        similarities = self._semantic_embeddings @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.SEMANTIC_THRESHOLD:
+            return self._semantic_results[best]
+        return None
+
+    def _cache_store(
+        self, key: bytes, result: R, embedding: T.Optional[np.ndarray]
+    ) -> None:
+        """
+        Store a response in both cache tiers.
+
+        Parameters
+        ----------
+        key : bytes
+            Exact-cache key for the prompt.
+        result : R
+            The selected response to cache.
+        embedding : np.ndarray or None
+            L2-normalized prompt embedding, if one was computed.
+        """
+        self._exact_cache[key] = result
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > self.CACHE_CAPACITY:
+            self._exact_cache.popitem(last=False)
+
+        if embedding is None:
+            return
+        self._semantic_results.append(result)
+        if self._semantic_embeddings is None:
+            self._semantic_embeddings = embedding[np.newaxis, :]
+        else:
+            self._semantic_embeddings = np.vstack(
+                [self._semantic_embeddings, embedding]
+            )
+        if len(self._semantic_results) > self.CACHE_CAPACITY:
+            self._semantic_results.pop(0)
+            self._semantic_embeddings = self._semantic_embeddings[1:]
+
     async def _call_llm(
         self, llm: LLM, prompt: str, messages: T.List[T.Dict[str, T.Any]], source: str
     ) -> dict:
@@ -166,13 +413,14 @@ class DualLLM(LLM[R]):
         dict
             Dictionary with keys: result, time, source.
         """
-        start = time.time()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         try:
             result = await llm.ask(prompt, messages)
-            return {"result": result, "time": time.time() - start, "source": source}
+            return {"result": result, "time": loop.time() - start, "source": source}
         except Exception as e:
             logging.error(f"{source} LLM error: {e}")
-            return {"result": None, "time": time.time() - start, "source": source}
+            return {"result": None, "time": loop.time() - start, "source": source}
 
     def _has_function_calls(self, entry: dict) -> bool:
         """
@@ -214,6 +462,20 @@ class DualLLM(LLM[R]):
             "local" or "cloud" indicating the better response.
         """
         try:
+            local_canonical = {(a.type, a.value) for a in local_entry["result"].actions}
+            cloud_canonical = {(a.type, a.value) for a in cloud_entry["result"].actions}
+
+            # Cheap deterministic pre-judge: only fire the judge LLM when
+            # the two action lists genuinely disagree.
+            if local_canonical == cloud_canonical or not cloud_canonical:
+                return "local"
+            if not local_canonical:
+                return "cloud"
+            if cloud_canonical < local_canonical:
+                return "local"
+            if local_canonical < cloud_canonical:
+                return "cloud"
+
             local_actions = [
                 {"type": a.type, "value": a.value}
                 for a in local_entry["result"].actions
@@ -223,30 +485,17 @@ class DualLLM(LLM[R]):
                 for a in cloud_entry["result"].actions
             ]
 
-            eval_prompt = f"""You are evaluating two AI responses to determine which better answers the user's question.
-
-Original User Question/Context:
-{prompt[:500]}
-
-Response A (local model):
-{json.dumps(local_actions, indent=2)}
-
-Response B (cloud model):
-{json.dumps(cloud_actions, indent=2)}
-
-Evaluate based on:
-1. Relevance - Which response better addresses the user's question?
-2. Completeness - Does it fully answer what was asked?
-3. Appropriateness - Are the actions suitable for the context?
-4. Quality - Is the content natural and engaging?
-
-Respond with ONLY a single word: either "A" or "B" for the better response."""
+            eval_prompt = _EVAL_TEMPLATE.format(
+                q=prompt[:500],
+                a=json.dumps(local_actions, separators=(",", ":")),
+                b=json.dumps(cloud_actions, separators=(",", ":")),
+            )
 
             response = await self._eval_client.chat.completions.create(
                 model=self._eval_model,
                 messages=[{"role": "user", "content": eval_prompt}],
                 temperature=0.0,
-                max_tokens=10,
+                max_tokens=1,
                 timeout=2.0,
                 extra_body={"chat_template_kwargs": {"enable_thinking": False}},
             )
@@ -259,8 +508,13 @@ Respond with ONLY a single word: either "A" or "B" for the better response."""
             if content is None:
                 return "local"
 
-            result = content.strip().upper()
-            return "local" if "A" in result else "cloud"
+            # Scan for the first A/B verdict char; tolerates "B." or "\nA"
+            for ch in content:
+                if ch in "Aa":
+                    return "local"
+                if ch in "Bb":
+                    return "cloud"
+            return "local"
         except Exception as e:
             logging.warning(f"LLM quality evaluation failed, defaulting to local: {e}")
             return "local"
@@ -288,12 +542,12 @@ Respond with ONLY a single word: either "A" or "B" for the better response."""
         local_has_function_call = self._has_function_calls(local_entry)
         cloud_has_function_call = self._has_function_calls(cloud_entry)
 
-        if local_has_function_call and not cloud_has_function_call:
-            return local_entry
-        if cloud_has_function_call and not local_has_function_call:
-            return cloud_entry
-        if not local_has_function_call and not cloud_has_function_call:
-            return local_entry
+        # 2-bit (local_has, cloud_has) index: neither/local-only → local,
+        # cloud-only → cloud, both → None (quality evaluation)
+        index = (local_has_function_call << 1) | cloud_has_function_call
+        chosen = (local_entry, cloud_entry, local_entry, None)[index]
+        if chosen is not None:
+            return chosen
 
         # Both have function calls → evaluate quality
         winner = await self._evaluate_quality(local_entry, cloud_entry, prompt)
@@ -323,88 +577,156 @@ Respond with ONLY a single word: either "A" or "B" for the better response."""
             self.io_provider.llm_start_time = time.time()
             self.io_provider.set_llm_prompt(prompt)
 
+            # Tier 1: exact prompt hash
+            cache_key = self._cache_key(prompt)
+            cached = self._exact_cache.get(cache_key)
+            if cached is not None:
+                self._exact_cache.move_to_end(cache_key)
+                self.io_provider.llm_end_time = time.time()
+                logging.debug("DualLLM exact cache hit, skipping LLM race.")
+                return cached
+
+            # Tier 2: embedding nearest-neighbor over prior prompts. The
+            # embedding is computed concurrently with the race rather than
+            # ahead of it, so a semantic miss costs no extra latency.
+            embed_task: T.Optional[asyncio.Task] = None
+            if self._embedding_model is not None:
+                embed_task = asyncio.create_task(self._embed_prompt(prompt))
+
             voice_input = _extract_voice_input(prompt)
 
+            local_llm, cloud_llm = self._ensure_llms()
+
             local_task = asyncio.create_task(
-                self._call_llm(self._local_llm, prompt, messages, "local")
+                self._call_llm(local_llm, prompt, messages, "local")
             )
             cloud_task = asyncio.create_task(
-                self._call_llm(self._cloud_llm, prompt, messages, "cloud")
+                self._call_llm(cloud_llm, prompt, messages, "cloud")
             )
             tasks = {"local": local_task, "cloud": cloud_task}
 
-            start_time = time.time()
-            in_time = {}
-
-            # Wait for responses until timeout
-            while (
-                len(in_time) < 2 and (time.time() - start_time) < self.TIMEOUT_THRESHOLD
-            ):
-                pending = [t for name, t in tasks.items() if name not in in_time]
-                if not pending:
-                    break
-
-                remaining = self.TIMEOUT_THRESHOLD - (time.time() - start_time)
-                if remaining <= 0:
-                    break
-
-                done, _ = await asyncio.wait(
-                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            loop = asyncio.get_running_loop()
+            race_start = loop.time()
+            chosen: T.Optional[dict] = None
+
+            # Give the semantic tier a chance to short-circuit the race:
+            # wait until the embedding or the fastest LLM finishes,
+            # whichever comes first, and bail out on a cache hit.
+            if embed_task is not None:
+                await asyncio.wait(
+                    {embed_task, local_task, cloud_task},
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-
-                for task in done:
-                    result = task.result()
-                    if (
-                        result["time"] <= self.TIMEOUT_THRESHOLD
-                        and result["result"] is not None
-                    ):
-                        in_time[result["source"]] = result
-
-            # Both in time → select best
-            if len(in_time) == 2:
-                logging.debug("Both LLMs responded in time, evaluating best response.")
-                chosen = await self._select_best(
-                    in_time["local"], in_time["cloud"], voice_input
+                if embed_task.done():
+                    cached = self._semantic_lookup(embed_task.result())
+                    if cached is not None:
+                        for task in tasks.values():
+                            task.cancel()
+                        asyncio.create_task(_reap_tasks(list(tasks.values())))
+                        self.io_provider.llm_end_time = time.time()
+                        logging.debug("DualLLM semantic cache hit, skipping LLM race.")
+                        return cached
+
+            # Speculative fastpath: a quick local function-calling
+            # response wins outright, saving the cloud round-trip.
+            if self._local_fastpath > 0:
+                try:
+                    early = await asyncio.wait_for(
+                        asyncio.shield(local_task),
+                        min(self._local_fastpath, self.TIMEOUT_THRESHOLD),
+                    )
+                except asyncio.TimeoutError:
+                    early = None
+                if early is not None and self._has_function_calls(early):
+                    chosen = early
+                    logging.debug("Local LLM fastpath hit, skipping cloud response.")
+
+            in_time: T.Dict[str, dict] = {}
+            if chosen is None:
+                remaining = max(
+                    self.TIMEOUT_THRESHOLD - (loop.time() - race_start), 0.0
                 )
 
-            # One in time → use it
-            elif len(in_time) == 1:
-                chosen = list(in_time.values())[0]
-                logging.debug(
-                    f"One LLM responded in time, using its response. {chosen['source']} LLM selected."
-                )
-                # Cancel the other task
-                for name, task in tasks.items():
-                    if name not in in_time:
-                        task.cancel()
-                        logging.debug(f"Cancelled {name} LLM task due to timeout.")
-
-            # Neither in time → wait for first to complete
-            else:
-                logging.debug(
-                    "Neither LLM responded in time, waiting for first to complete."
+                # Single gather with a shared deadline; the shields keep the
+                # underlying tasks alive past a timeout so the late-response
+                # fallback below can still await them.
+                results = await asyncio.gather(
+                    asyncio.wait_for(asyncio.shield(local_task), remaining),
+                    asyncio.wait_for(asyncio.shield(cloud_task), remaining),
+                    return_exceptions=True,
                 )
-                pending = [t for t in tasks.values() if not t.done()]
-                if pending:
-                    done, rest = await asyncio.wait(
-                        pending, return_when=asyncio.FIRST_COMPLETED
+                for result in results:
+                    if isinstance(result, BaseException):
+                        continue
+                    if result["result"] is not None:
+                        in_time[result["source"]] = result
+
+            # The fastpath may already have picked a winner; otherwise
+            # select from whatever the race produced
+            if chosen is None:
+                # Both in time → select best
+                if len(in_time) == 2:
+                    logging.debug(
+                        "Both LLMs responded in time, evaluating best response."
+                    )
+                    chosen = await self._select_best(
+                        in_time["local"], in_time["cloud"], voice_input
                     )
-                    chosen = list(done)[0].result()
+
+                # One in time → use it
+                elif len(in_time) == 1:
+                    chosen = next(iter(in_time.values()))
                     logging.debug(
-                        f"Using first completed LLM response from {chosen['source']} LLM."
+                        f"One LLM responded in time, using its response. {chosen['source']} LLM selected."
                     )
-                    for task in rest:
-                        task.cancel()
-                        logging.debug(f"Cancelled {task} LLM task due to timeout.")
+
+                # Neither in time → wait for first to complete
                 else:
-                    # Both already completed (just late)
-                    results = [t.result() for t in tasks.values()]
-                    chosen = min(results, key=lambda x: x["time"])
+                    logging.debug(
+                        "Neither LLM responded in time, waiting for first to complete."
+                    )
+                    pending = [t for t in tasks.values() if not t.done()]
+                    if pending:
+                        done, _ = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        chosen = next(iter(done)).result()
+                        logging.debug(
+                            f"Using first completed LLM response from {chosen['source']} LLM."
+                        )
+                    else:
+                        # Both already completed (just late)
+                        results = [t.result() for t in tasks.values()]
+                        chosen = min(results, key=lambda x: x["time"])
+
+            # Deterministic teardown of the losing task(s): cancel and
+            # reap them in the background so the reply is not blocked and
+            # no CancelledError or pending-task warning leaks.
+            losers = [
+                task
+                for name, task in tasks.items()
+                if name != chosen["source"] and not task.done()
+            ]
+            if losers:
+                for task in losers:
+                    task.cancel()
+                    logging.debug("Cancelled losing LLM task.")
+                asyncio.create_task(_reap_tasks(losers))
 
             self.io_provider.llm_end_time = time.time()
 
+            # Harvest the embedding if it arrived; never block on it
+            embedding: T.Optional[np.ndarray] = None
+            if embed_task is not None:
+                if embed_task.done():
+                    embedding = embed_task.result()
+                else:
+                    embed_task.cancel()
+
             if chosen and chosen["result"]:
-                return T.cast(R, chosen["result"])
+                result = T.cast(R, chosen["result"])
+                self._cache_store(cache_key, result, embedding)
+                return result
             return None
 
         except Exception as e:
@@ -13,6 +13,36 @@ from providers.llm_history_manager import LLMHistoryManager
 
 R = T.TypeVar("R", bound=BaseModel)
 
+_client_pool: T.Dict[T.Tuple[str, str], openai.AsyncClient] = {}
+
+
+def _get_shared_client(base_url: str, api_key: str) -> openai.AsyncClient:
+    """
+    Return a process-wide AsyncClient for the given endpoint/key pair.
+
+    Instances are cached so every OpenAILLM pointed at the same endpoint
+    shares one connection pool instead of re-opening connections per
+    instantiation.
+
+    Parameters
+    ----------
+    base_url : str
+        Base URL of the OpenAI-compatible endpoint.
+    api_key : str
+        Authentication key for the endpoint.
+
+    Returns
+    -------
+    openai.AsyncClient
+        Shared client for the endpoint/key pair.
+    """
+    key = (base_url, api_key)
+    client = _client_pool.get(key)
+    if client is None:
+        client = openai.AsyncClient(base_url=base_url, api_key=api_key)
+        _client_pool[key] = client
+    return client
+
 
 class OpenAILLM(LLM[R]):
     """
@@ -53,9 +83,9 @@ class OpenAILLM(LLM[R]):
         if not config.model:
             self._config.model = "gpt-4.1-mini"
 
-        self._client = openai.AsyncClient(
-            base_url=config.base_url or "https://api.openmind.org/api/core/openai",
-            api_key=config.api_key,
+        self._client = _get_shared_client(
+            config.base_url or "https://api.openmind.org/api/core/openai",
+            config.api_key,
         )
 
         # Initialize history manager
@@ -1,4 +1,7 @@
+import itertools
 import logging
+import queue
+import threading
 from uuid import uuid4
 
 import zenoh
@@ -26,6 +29,27 @@ class AvatarProvider:
         Initialize the AvatarProvider.
         """
         self.session = None
+        # Cache enum values so the hot subscriber callback skips the
+        # descriptor lookup on every message
+        self._STATUS_CODE = AvatarFaceRequest.Code.STATUS.value
+        self._ACTIVE_CODE = AvatarFaceResponse.Code.ACTIVE.value
+        # Healthcheck header IDs: a per-boot random prefix plus a
+        # monotonic counter is unique enough for correlation and skips
+        # the os.urandom syscall a UUID would cost per ping
+        self._boot_id = uuid4().hex[:8]
+        self._header_counter = itertools.count()
+        # Constant healthcheck message body, created once and shared by
+        # every reply
+        self._active_message = String("Avatar system active")
+        # Response skeleton reused for every healthcheck reply; only the
+        # header and request_id vary per message. Safe because only the
+        # tx worker thread touches it.
+        self._active_response = AvatarFaceResponse(
+            header=prepare_header(""),
+            request_id=String(""),
+            code=self._ACTIVE_CODE,
+            message=self._active_message,
+        )
         # Face Publisher
         self.avatar_publisher = None
         # Health Check Publisher and Subscriber
@@ -33,6 +57,13 @@ class AvatarProvider:
         self.avatar_subscriber = None
         self.running = False
 
+        # Healthcheck replies are built and published off the Zenoh
+        # subscriber thread so the callback returns immediately; the
+        # queue is bounded and drops the oldest entry under bursts
+        self._tx_queue: queue.Queue = queue.Queue(maxsize=64)
+        self._tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+        self._tx_thread.start()
+
         self._initialize_zenoh()
 
     def _initialize_zenoh(self):
@@ -51,7 +82,7 @@ class AvatarProvider:
             self.running = True
             logging.info("AvatarProvider initialized with Zenoh on topics")
         except Exception as e:
-            logging.error(f"Failed to initialize AvatarProvider Zenoh session: {e}")
+            logging.error("Failed to initialize AvatarProvider Zenoh session: %s", e)
 
     def _handle_avatar_request(self, sample: zenoh.Sample):
         """
@@ -68,21 +99,56 @@ class AvatarProvider:
         try:
             request = AvatarFaceRequest.deserialize(sample.payload.to_bytes())
 
-            if request.code == AvatarFaceRequest.Code.STATUS.value:
+            if request.code == self._STATUS_CODE:
                 logging.debug("Received avatar health check request")
+                self._enqueue_response(request.request_id)
+        except Exception as e:
+            logging.error("Error handling avatar request: %s", e)
+
+    def _enqueue_response(self, request_id: String):
+        """
+        Queue a healthcheck reply for the tx worker, dropping the oldest
+        pending reply if the queue is full.
 
-                response = AvatarFaceResponse(
-                    header=prepare_header(str(uuid4())),
-                    request_id=request.request_id,
-                    code=AvatarFaceResponse.Code.ACTIVE.value,
-                    message=String("Avatar system active"),
+        Parameters
+        ----------
+        request_id : String
+            Request ID to echo back in the response.
+        """
+        try:
+            self._tx_queue.put_nowait(request_id)
+        except queue.Full:
+            try:
+                self._tx_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._tx_queue.put_nowait(request_id)
+            except queue.Full:
+                pass
+
+    def _tx_loop(self):
+        """
+        Worker loop that builds and publishes healthcheck replies.
+
+        Runs on a dedicated daemon thread; a None sentinel stops it.
+        """
+        while True:
+            request_id = self._tx_queue.get()
+            if request_id is None:
+                break
+            try:
+                response = self._active_response
+                response.header = prepare_header(
+                    f"{self._boot_id}-{next(self._header_counter):016x}"
                 )
+                response.request_id = request_id
 
                 if self.avatar_healthcheck_publisher:
                     self.avatar_healthcheck_publisher.put(response.serialize())
                     logging.debug("Sent avatar active response")
-        except Exception as e:
-            logging.error(f"Error handling avatar request: {e}")
+            except Exception as e:
+                logging.error("Error publishing avatar response: %s", e)
 
     def send_avatar_command(self, command: str) -> bool:
         """
@@ -99,14 +165,14 @@ class AvatarProvider:
         """
         if not self.running or not self.avatar_publisher:
             logging.warning(
-                f"AvatarProvider not running, cannot send command: {command}"
+                "AvatarProvider not running, cannot send command: %s", command
             )
             return False
 
         command = command.lower()
 
         try:
-            request_id = str(uuid4())
+            request_id = uuid4().hex
             face_text = command
 
             face_msg = AvatarFaceRequest(
@@ -116,11 +182,11 @@ class AvatarProvider:
                 face_text=String(face_text),
             )
             self.avatar_publisher.put(face_msg.serialize())
-            logging.info(f"AvatarProvider sent command to Zenoh: {face_text}")
+            logging.info("AvatarProvider sent command to Zenoh: %s", face_text)
             return True
 
         except Exception as e:
-            logging.error(f"Failed to send avatar command via Zenoh: {e}")
+            logging.error("Failed to send avatar command via Zenoh: %s", e)
             return False
 
     def stop(self):
@@ -133,6 +199,10 @@ class AvatarProvider:
 
         self.running = False
 
+        if self._tx_thread.is_alive():
+            self._tx_queue.put(None)
+            self._tx_thread.join(timeout=1.0)
+
         if self.avatar_subscriber:
             self.avatar_subscriber.undeclare()
             self.avatar_subscriber = None
@@ -1,7 +1,8 @@
-import json
 import logging
 from typing import Any, Dict, Optional
 
+import orjson
+
 import zenoh
 
 from zenoh_msgs import open_zenoh_session
@@ -25,6 +26,7 @@ class ContextProvider:
         self.context_update_topic = "om/mode/context"
         self.session: Optional[zenoh.Session] = None
         self.publisher = None
+        self._context: Dict[str, Any] = {}
         self._initialize_zenoh()
 
     def _initialize_zenoh(self):
@@ -33,7 +35,13 @@ class ContextProvider:
         """
         try:
             self.session = open_zenoh_session()
-            self.publisher = self.session.declare_publisher(self.context_update_topic)
+            # Mode-change context is latency-critical: express=True skips
+            # Zenoh's transmit batching and REAL_TIME jumps the send queues
+            self.publisher = self.session.declare_publisher(
+                self.context_update_topic,
+                express=True,
+                priority=zenoh.Priority.REAL_TIME,
+            )
             logging.info("ContextProvider Zenoh session initialized")
         except Exception as e:
             logging.error(f"Error initializing ContextProvider Zenoh session: {e}")
@@ -49,21 +57,17 @@ class ContextProvider:
         context : Dict[str, Any]
             The context information to update. This will be merged with existing context.
         """
-        if not self.publisher:
-            logging.warning("ContextProvider not initialized, cannot update context")
-            return
-
-        try:
-            context_json = json.dumps(context)
-            self.publisher.put(context_json.encode("utf-8"))
-            logging.debug(f"Sent context update: {context}")
-        except Exception as e:
-            logging.error(f"Error sending context update: {e}")
+        self._context.update(context)
+        self._publish_context()
 
     def set_context_field(self, key: str, value: Any):
         """
         Update a single context field.
 
+        Updates the persistent context dict in place instead of building a
+        fresh single-key dict per call, so high-rate field updates avoid
+        per-call dict allocations.
+
         Parameters
         ----------
         key : str
@@ -71,7 +75,25 @@ class ContextProvider:
         value : Any
             The value to set for this key
         """
-        self.update_context({key: value})
+        self._context[key] = value
+        self._publish_context()
+
+    def _publish_context(self):
+        """
+        Serialize the current context and publish it.
+
+        No-op with a warning when the provider failed to initialize.
+        """
+        publisher = self.publisher
+        if not publisher:
+            logging.warning("ContextProvider not initialized, cannot update context")
+            return
+
+        try:
+            publisher.put(orjson.dumps(self._context))
+            logging.debug(f"Sent context update: {self._context}")
+        except Exception as e:
+            logging.error(f"Error sending context update: {e}")
 
     def stop(self):
         """
@@ -1,6 +1,7 @@
 import logging
 import math
 
+import numpy as np
 import zenoh
 
 from zenoh_msgs import open_zenoh_session, sensor_msgs
@@ -54,6 +55,27 @@ class D435Provider:
 
         return angle_degrees, distance
 
+    def calculate_angle_and_distance_batch(self, xs, ys) -> tuple:
+        """
+        Vectorized variant of calculate_angle_and_distance for whole frames.
+
+        Parameters
+        ----------
+        xs : array_like
+            The x-coordinates in the world.
+        ys : array_like
+            The y-coordinates in the world.
+
+        Returns
+        -------
+        tuple
+            A tuple of NumPy arrays containing the angles in degrees and
+            the distances, one entry per input point.
+        """
+        xs = np.asarray(xs, dtype=np.float32)
+        ys = np.asarray(ys, dtype=np.float32)
+        return np.degrees(np.arctan2(ys, xs)), np.hypot(xs, ys)
+
     def obstacle_callback(self, sample: zenoh.Sample):
         """
         Callback function to process the obstacle point cloud data.
@@ -1,21 +1,56 @@
-import json
 import logging
 import os
+import queue
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 
+import httpx
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from .singleton import singleton
 
+# Structure-of-arrays layout for raw BLE scans; one packed row per packet
+# instead of one RFDataRaw object per packet
+RF_DATA_RAW_DTYPE = np.dtype(
+    [("unix_ts", "f8"), ("address", "U17"), ("rssi", "i2"), ("packet", "O")]
+)
 
-@dataclass
+
+def rf_data_raw_to_array(records: "List[RFDataRaw]") -> np.ndarray:
+    """
+    Pack a list of RFDataRaw records into a structured NumPy array.
+
+    Parameters
+    ----------
+    records : List[RFDataRaw]
+        The raw scan records to pack.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with RF_DATA_RAW_DTYPE, one row per record.
+    """
+    return np.fromiter(
+        ((r.unix_ts, r.address, r.rssi, r.packet) for r in records),
+        dtype=RF_DATA_RAW_DTYPE,
+        count=len(records),
+    )
+
+
+@dataclass(slots=True)
 class RFData:
     """
     Data class to represent RF scan results.
 
+    Slotted to cut per-instance memory; ble_scan may hold thousands of
+    these at once.
+
     Parameters
     ----------
     unix_ts : float
@@ -66,7 +101,7 @@ class RFData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RFDataRaw:
     """
     Data class to represent RF scan results.
@@ -133,6 +168,7 @@ class FabricData:
     odom_yaw_m180_p180: float
     rf_data: List[RFData]
     rf_data_raw: List[RFDataRaw]
+    rf_data_raw_np: Optional[np.ndarray] = None
 
     def to_dict(self) -> dict:
         """
@@ -165,11 +201,28 @@ class FabricData:
             "odom_rockchip_ts": self.odom_rockchip_ts,
             "odom_subscriber_ts": self.odom_subscriber_ts,
             "rf_data": [rf.to_dict() for rf in self.rf_data] if self.rf_data else [],
-            "rf_data_raw": (
-                [rf.to_dict() for rf in self.rf_data_raw] if self.rf_data_raw else []
-            ),
+            "rf_data_raw": self._rf_data_raw_dicts(),
         }
 
+    def _rf_data_raw_dicts(self) -> list:
+        """
+        Render raw scan records as JSON-ready dicts.
+
+        Prefers the packed rf_data_raw_np representation when set; the
+        legacy list-of-dataclasses path is kept as a fallback.
+
+        Returns
+        -------
+        list
+            One dict per raw scan record.
+        """
+        if self.rf_data_raw_np is not None:
+            names = self.rf_data_raw_np.dtype.names
+            return [dict(zip(names, row)) for row in self.rf_data_raw_np.tolist()]
+        if self.rf_data_raw:
+            return [rf.to_dict() for rf in self.rf_data_raw]
+        return []
+
 
 @singleton
 class FabricDataSubmitter:
@@ -182,6 +235,9 @@ class FabricDataSubmitter:
         api_key: Optional[str] = None,
         base_url: str = "https://api.openmind.org/api/core/fabric/submit",
         write_to_local_file: bool = False,
+        put_batch_size: int = 1,
+        put_batch_timeout_ms: int = 200,
+        use_httpx: bool = True,
     ):
         """
         Initialize the FabricDataSubmitter.
@@ -193,6 +249,20 @@ class FabricDataSubmitter:
         base_url : str
             Base URL for the teleops status API. Default is
             "https://api.openmind.org/api/core/fabric/submit".
+        write_to_local_file : bool
+            Whether to also append payloads to a local JSONL file.
+            Default is False.
+        put_batch_size : int
+            Number of payloads to accumulate before one batched POST.
+            Default is 1 (submit each payload individually).
+        put_batch_timeout_ms : int
+            Maximum time to wait for a batch to fill before flushing a
+            partial batch. 0 waits until the batch is full. Default
+            is 200, so a partial batch is never held for long.
+        use_httpx : bool
+            Use an HTTP/2-capable httpx client so concurrent submissions
+            multiplex on one connection. False falls back to a pooled
+            requests.Session. Default is True.
         """
         self.api_key = api_key
         self.base_url = base_url
@@ -200,8 +270,36 @@ class FabricDataSubmitter:
         self.filename_base = "dump/fabric"
         self.filename_current = self.update_filename()
         self.max_file_size_bytes = 1024 * 1024
+        self.flush_threshold_bytes = 64 * 1024
+        self.flush_interval_s = 0.1
+        self._fh: Optional[BinaryIO] = None
+        self._pending_bytes = 0
+        self._last_flush = time.monotonic()
         self.executor = ThreadPoolExecutor(max_workers=1)
 
+        # Both transports reuse connections across submissions; HTTP/2
+        # additionally multiplexes concurrent POSTs on one connection
+        if use_httpx:
+            self._client = httpx.Client(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=8),
+            )
+        else:
+            self._client = requests.Session()
+            self._client.mount(
+                "https://",
+                HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=3),
+            )
+
+        self.put_batch_size = put_batch_size
+        self.put_batch_timeout_ms = put_batch_timeout_ms
+        self._batch_queue: Optional[queue.Queue] = None
+        if put_batch_size > 1:
+            self._batch_queue = queue.Queue()
+            self._batch_thread = threading.Thread(target=self._batch_loop, daemon=True)
+            self._batch_thread.start()
+
     def update_filename(self):
         """
         Update the filename for local logging with a timestamp.
@@ -214,8 +312,12 @@ class FabricDataSubmitter:
 
     def write_dict_to_file(self, data: dict):
         """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
+        Writes a dictionary to a long-lived buffered file in JSON lines format.
+        If the file exceeds max_file_size_bytes, creates a new file with a
+        timestamp. Writes land in a userspace buffer and reach disk via
+        flush() once flush_threshold_bytes are pending or flush_interval_s
+        has elapsed since the last sync, so low-rate writers still flush
+        per record while bursts amortize the syscalls.
 
         Parameters
         ----------
@@ -225,17 +327,39 @@ class FabricDataSubmitter:
         if not isinstance(data, dict):
             raise ValueError("Provided data must be a dictionary.")
 
-        if (
-            os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
+        if self._fh is not None and self._fh.tell() > self.max_file_size_bytes:
+            self.flush()
+            self._fh.close()
+            self._fh = None
             self.filename_current = self.update_filename()
             logging.info(f"new file name: {self.filename_current}")
 
-        with open(self.filename_current, "a", encoding="utf-8") as f:
-            json_line = json.dumps(data)
-            f.write(json_line + "\n")
-            f.flush()
+        if self._fh is None or self._fh.name != self.filename_current:
+            if self._fh is not None:
+                self.flush()
+                self._fh.close()
+            self._fh = open(self.filename_current, "ab", buffering=1 << 16)
+
+        line = orjson.dumps(data)
+        self._fh.write(line)
+        self._fh.write(b"\n")
+        self._pending_bytes += len(line) + 1
+        if (
+            self._pending_bytes >= self.flush_threshold_bytes
+            or time.monotonic() - self._last_flush >= self.flush_interval_s
+        ):
+            self.flush()
+
+    def flush(self):
+        """
+        Flush buffered local-file writes and fsync them to disk.
+        """
+        self._last_flush = time.monotonic()
+        if self._fh is None:
+            return
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._pending_bytes = 0
 
     def _share_data_worker(self, data: FabricData):
         """
@@ -263,7 +387,7 @@ class FabricDataSubmitter:
             return
 
         try:
-            request = requests.post(
+            request = self._client.post(
                 self.base_url,
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 json=json_dict,
@@ -279,11 +403,88 @@ class FabricDataSubmitter:
         except Exception as e:
             logging.error(f"Error sharing data: {str(e)}")
 
+    def _batch_loop(self):
+        """
+        Worker loop that accumulates payloads and submits them as batches.
+
+        Blocks for the first payload, then fills the batch up to
+        put_batch_size, waiting at most put_batch_timeout_ms for each
+        additional payload before flushing a partial batch. A None
+        sentinel flushes whatever is batched and stops the loop.
+        """
+        # The loop is only started when batching is enabled
+        batch_queue = self._batch_queue
+        if batch_queue is None:
+            return
+
+        timeout = self.put_batch_timeout_ms / 1000.0 or None
+        while True:
+            item = batch_queue.get()
+            if item is None:
+                break
+            batch = [item]
+            stopping = False
+            while len(batch) < self.put_batch_size:
+                try:
+                    item = batch_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._share_batch_worker(batch)
+            if stopping:
+                break
+
+    def _share_batch_worker(self, batch: List[FabricData]):
+        """
+        Submit a batch of payloads to FABRIC with a single POST.
+
+        Parameters
+        ----------
+        batch : List[FabricData]
+            The payloads to be shared.
+        """
+        logging.debug(f"_share_batch_worker: {len(batch)} payloads")
+        try:
+            json_dicts = [data.to_dict() for data in batch]
+        except Exception as e:
+            logging.error(f"Error converting to dict: {str(e)}")
+            return
+
+        if self.write_to_local_file:
+            for json_dict in json_dicts:
+                self.write_dict_to_file(json_dict)
+            logging.info(f"FDS wrote to {self.filename_current}")
+
+        if self.api_key is None or self.api_key == "":
+            logging.error("API key missing. Cannot share data to FABRIC.")
+            return
+
+        try:
+            request = self._client.post(
+                self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                json=json_dicts,
+                timeout=10,
+            )
+
+            if request.status_code == 201:
+                logging.debug(f"Batch of {len(batch)} shared")
+            else:
+                logging.error(
+                    f"Failed to share batch: {request.status_code} - {request.text}"
+                )
+        except Exception as e:
+            logging.error(f"Error sharing batch: {str(e)}")
+
     def share_data(self, data: FabricData):
         """
         Share mapping data.
         This function submits mapping data collected by a machine to a thread pool executor
-        to run in a separate thread.
+        to run in a separate thread, or queues it for the batch worker
+        when batching is enabled.
 
         Parameters
         ----------
@@ -291,4 +492,25 @@ class FabricDataSubmitter:
             A mapping data payload to submit.
         """
         logging.debug(f"share data: {data}")
-        self.executor.submit(self._share_data_worker, data)
+        if self._batch_queue is not None:
+            self._batch_queue.put(data)
+        else:
+            self.executor.submit(self._share_data_worker, data)
+
+    def stop(self):
+        """
+        Drain pending work and stop the submitter.
+
+        Flushes any partial batch through the batch worker, waits for
+        queued executor jobs to finish, and syncs the local log file.
+        """
+        if self._batch_queue is not None and self._batch_thread.is_alive():
+            self._batch_queue.put(None)
+            self._batch_thread.join(timeout=15.0)
+
+        self.executor.shutdown(wait=True)
+
+        if self._fh is not None:
+            self.flush()
+            self._fh.close()
+            self._fh = None
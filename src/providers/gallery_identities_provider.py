@@ -3,19 +3,26 @@
 import logging
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .singleton import singleton
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentitiesSnapshot:
     """
     Canonical record returned by `/gallery/identities`.
 
+    The summary line is rendered once in `__post_init__`; each snapshot may
+    be rendered by several registered callbacks, so repeated `to_text()`
+    calls just return the cached string.
+
     Attributes
     ----------
     ts : float
@@ -37,6 +44,13 @@ class IdentitiesSnapshot:
     total: int
     names: List[str]
     raw: Dict
+    _text: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Precompute the formatted text line from the cleaned identity names."""
+        cleaned = ((n or "").strip() for n in self.names or [])
+        uniq = dict.fromkeys(n for n in cleaned if n)
+        self._text = f"total={self.total} ids=[{', '.join(uniq)}]"
 
     def to_text(self) -> str:
         """
@@ -47,14 +61,7 @@ class IdentitiesSnapshot:
         str
             Formatted string like "total=3 ids=[Alice, Bob, Charlie]".
         """
-        seen = set()
-        ordered = []
-        for n in self.names or []:
-            n = (n or "").strip()
-            if n and n not in seen:
-                seen.add(n)
-                ordered.append(n)
-        return f"total={self.total} ids=[{', '.join(ordered)}]"
+        return self._text
 
 
 @singleton
@@ -97,6 +104,15 @@ class GalleryIdentitiesProvider:
         self._cb_lock = threading.Lock()
 
         self._session = requests.Session()
+        # Pooled adapter keeps the TCP connection alive across polls, so
+        # steady-state polling skips the per-request connect handshake
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def register_message_callback(self, fn: Callable[[str], None]) -> None:
         """
@@ -203,7 +219,9 @@ class GalleryIdentitiesProvider:
         url = f"{self.base_url}/gallery/identities"
         r = self._session.post(url, json={}, timeout=self.timeout_s)  # type: ignore
         r.raise_for_status()
-        data = r.json() or {}
+        # orjson decodes the body noticeably faster than Response.json()
+        # on this polling hot path
+        data = orjson.loads(r.content) if r.content else {}
 
         ok = bool(data.get("ok"))
         if not ok:
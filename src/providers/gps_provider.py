@@ -1,8 +1,8 @@
+import calendar
 import logging
 import re
 import threading
 import time
-from datetime import datetime, timezone
 from typing import List, Optional
 
 import serial
@@ -78,6 +78,9 @@ class GpsProvider:
         Convert a time string in the format 'YYYY:MM:DD:HH:MM:SS:ms'
         to a Unix timestamp (UTC).
 
+        Parsed with fixed-offset int() slices instead of datetime.strptime,
+        which is much cheaper on this per-sentence hot path.
+
         Parameters
         ----------
         time_str : str
@@ -88,9 +91,21 @@ class GpsProvider:
         float
             The corresponding Unix timestamp.
         """
-        dt = datetime.strptime(time_str, "%Y:%m:%d:%H:%M:%S:%f")
-        dt = dt.replace(tzinfo=timezone.utc)
-        return dt.timestamp()
+        s = time_str
+        whole = calendar.timegm(
+            (
+                int(s[0:4]),
+                int(s[5:7]),
+                int(s[8:10]),
+                int(s[11:13]),
+                int(s[14:16]),
+                int(s[17:19]),
+                0,
+                0,
+                0,
+            )
+        )
+        return whole + int(s[20:23]) / 1000.0
 
     def magGPSProcessor(self, data: str):
         """
@@ -1,5 +1,24 @@
+import os
 import threading
-from typing import Any
+from typing import Any, Dict
+
+
+def _scope_key() -> str:
+    """
+    Determine the key under which singleton instances are stored.
+
+    Production uses a single shared "global" key. When OM1_SINGLETON_SCOPE
+    is set to "worker" (done by the test suite), instances are keyed by the
+    pytest-xdist worker id (or thread id as a fallback) so parallel test
+    workers do not share or clobber each other's provider instances.
+
+    Returns
+    -------
+        str: The scope key for the current context.
+    """
+    if os.environ.get("OM1_SINGLETON_SCOPE") == "worker":
+        return os.environ.get("PYTEST_XDIST_WORKER") or str(threading.get_ident())
+    return "global"
 
 
 def singleton(cls):
@@ -8,7 +27,8 @@ def singleton(cls):
 
     This decorator implements a singleton pattern with thread safety using a lock.
     Multiple threads attempting to create an instance will be synchronized to prevent
-    race conditions.
+    race conditions. Instances are stored per scope key (see _scope_key) so test
+    workers can be isolated; in production there is a single "global" scope.
 
     Args:
         cls: The class to be converted into a singleton.
@@ -17,8 +37,7 @@ def singleton(cls):
     -------
         function: A getter function that returns the singleton instance.
     """
-    if not hasattr(cls, "_singleton_instance"):
-        cls._singleton_instance = None
+    instances: Dict[str, Any] = {}
     lock = threading.Lock()
 
     def get_instance(*args, **kwargs) -> Any:
@@ -36,20 +55,22 @@ def singleton(cls):
         -------
             Any: The singleton instance of the decorated class.
         """
+        key = _scope_key()
         with lock:
-            if cls._singleton_instance is None:
-                cls._singleton_instance = cls(*args, **kwargs)
-            return cls._singleton_instance
+            if key not in instances:
+                instances[key] = cls(*args, **kwargs)
+            return instances[key]
 
     def reset_instance():
         """
         Resets the singleton instance of the decorated class.
 
-        This method sets the singleton instance to None, allowing a new instance
-        to be created on the next call to get_instance.
+        This method removes the instance for the current scope, allowing a new
+        instance to be created on the next call to get_instance. Other scopes
+        (e.g. parallel test workers) are left untouched.
         """
         with lock:
-            cls._singleton_instance = None
+            instances.pop(_scope_key(), None)
 
     get_instance._singleton_class = cls  # type: ignore
     get_instance.reset = reset_instance  # type: ignore
@@ -9,6 +9,13 @@ import dotenv
 import json5
 import typer
 
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 from runtime.logging import setup_logging
 from runtime.multi_mode.config import load_mode_config
 from runtime.multi_mode.cortex import ModeCortexRuntime
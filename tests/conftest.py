@@ -0,0 +1,6 @@
+import os
+
+
+def pytest_configure(config):
+    """Scope provider singletons per test worker so pytest-xdist can shard."""
+    os.environ.setdefault("OM1_SINGLETON_SCOPE", "worker")
@@ -163,13 +163,14 @@ async def test_race_both_fast_cloud_has_function(dual_llm):
 
 @pytest.mark.asyncio
 async def test_race_both_fast_both_functions_eval(dual_llm):
-    """Test scenario: Both fast and have functions -> LLM Judge decides"""
-    local_result = CortexOutputModel(actions=[Action(type="f", value="v")])
-    cloud_result = CortexOutputModel(actions=[Action(type="f", value="v")])
+    """Test scenario: Both fast with diverging functions -> LLM Judge decides"""
+    local_result = CortexOutputModel(actions=[Action(type="f", value="v1")])
+    cloud_result = CortexOutputModel(actions=[Action(type="f", value="v2")])
 
     dual_llm._local_llm.ask = AsyncMock(return_value=local_result)
     dual_llm._cloud_llm.ask = AsyncMock(return_value=cloud_result)
     dual_llm.TIMEOUT_THRESHOLD = 1.0
+    dual_llm._local_fastpath = 0
 
     mock_eval_response = MagicMock()
     mock_eval_response.choices = [MagicMock(message=MagicMock(content="B"))]
@@ -183,6 +184,110 @@ async def test_race_both_fast_both_functions_eval(dual_llm):
     assert dual_llm._eval_client.chat.completions.create.called
 
 
+@pytest.mark.asyncio
+async def test_local_fastpath_skips_cloud(dual_llm):
+    """Test scenario: Fast local function call wins without judge or cloud wait"""
+    local_result = CortexOutputModel(actions=[Action(type="f", value="v1")])
+    cloud_result = CortexOutputModel(actions=[Action(type="f", value="v2")])
+
+    async def slow_cloud(*args):
+        await asyncio.sleep(0.5)
+        return cloud_result
+
+    dual_llm._local_llm.ask = AsyncMock(return_value=local_result)
+    dual_llm._cloud_llm.ask = AsyncMock(side_effect=slow_cloud)
+    dual_llm.TIMEOUT_THRESHOLD = 1.0
+
+    dual_llm._eval_client.chat.completions.create = AsyncMock()
+
+    response = await dual_llm.ask("test prompt")
+
+    assert response == local_result
+    assert not dual_llm._eval_client.chat.completions.create.called
+
+
+@pytest.mark.asyncio
+async def test_race_both_functions_agree_skips_eval(dual_llm):
+    """Test scenario: Both have identical functions -> local wins without judge"""
+    local_result = CortexOutputModel(actions=[Action(type="f", value="v")])
+    cloud_result = CortexOutputModel(actions=[Action(type="f", value="v")])
+
+    dual_llm._local_llm.ask = AsyncMock(return_value=local_result)
+    dual_llm._cloud_llm.ask = AsyncMock(return_value=cloud_result)
+    dual_llm.TIMEOUT_THRESHOLD = 1.0
+
+    dual_llm._eval_client.chat.completions.create = AsyncMock()
+
+    response = await dual_llm.ask("test prompt")
+
+    assert response == local_result
+    assert not dual_llm._eval_client.chat.completions.create.called
+
+
+@pytest.mark.asyncio
+async def test_exact_cache_hit_skips_race(dual_llm):
+    """Test scenario: Repeated prompt is served from cache without re-racing"""
+    local_result = CortexOutputModel(actions=[Action(type="func", value="val")])
+    cloud_result = CortexOutputModel(actions=[])
+
+    dual_llm._local_llm.ask = AsyncMock(return_value=local_result)
+    dual_llm._cloud_llm.ask = AsyncMock(return_value=cloud_result)
+    dual_llm.TIMEOUT_THRESHOLD = 1.0
+
+    first = await dual_llm.ask("repeated prompt")
+    second = await dual_llm.ask("repeated prompt")
+
+    assert first == local_result
+    assert second == local_result
+    assert dual_llm._local_llm.ask.call_count == 1
+    assert dual_llm._cloud_llm.ask.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_tier_disabled_by_default(dual_llm):
+    """Test scenario: No embedding model configured -> no embedding calls"""
+    dual_llm._local_llm.ask = AsyncMock(return_value=CortexOutputModel(actions=[]))
+    dual_llm._cloud_llm.ask = AsyncMock(return_value=CortexOutputModel(actions=[]))
+    dual_llm.TIMEOUT_THRESHOLD = 1.0
+
+    dual_llm._eval_client.embeddings.create = AsyncMock()
+
+    await dual_llm.ask("test prompt")
+
+    assert not dual_llm._eval_client.embeddings.create.called
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_hit_skips_race(dual_llm):
+    """Test scenario: Near-duplicate prompt is served from the semantic tier"""
+    local_result = CortexOutputModel(actions=[Action(type="f", value="v")])
+    completions = []
+
+    async def slow_llm(*args):
+        await asyncio.sleep(0.2)
+        completions.append(1)
+        return local_result
+
+    dual_llm._local_llm.ask = AsyncMock(side_effect=slow_llm)
+    dual_llm._cloud_llm.ask = AsyncMock(side_effect=slow_llm)
+    dual_llm.TIMEOUT_THRESHOLD = 1.0
+    dual_llm._embedding_model = "test-embedding"
+
+    mock_embedding = MagicMock()
+    mock_embedding.data = [MagicMock(embedding=[1.0, 0.0])]
+    dual_llm._eval_client.embeddings.create = AsyncMock(return_value=mock_embedding)
+
+    first = await dual_llm.ask("first prompt")
+    raced = len(completions)
+    second = await dual_llm.ask("similar prompt")
+
+    assert first == local_result
+    assert second == local_result
+    # The second ask was answered from the semantic cache, so no further
+    # LLM call ran to completion
+    assert len(completions) == raced
+
+
 @pytest.mark.asyncio
 async def test_timeout_both_slow(dual_llm):
     """Test scenario: Both slow -> Wait for first to complete"""
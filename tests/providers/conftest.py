@@ -0,0 +1,37 @@
+import pytest
+
+from providers.fabric_map_provider import FabricData
+
+
+@pytest.fixture(scope="module")
+def make_fabric_data():
+    """Factory for FabricData payloads with sensible test defaults."""
+    defaults = dict(
+        machine_id="test_machine",
+        payload_idx=1,
+        gps_unix_ts=1234567890.0,
+        gps_lat=37.7749,
+        gps_lon=-122.4194,
+        gps_alt=10.0,
+        gps_qua=2,
+        rtk_unix_ts=0.0,
+        rtk_lat=0.0,
+        rtk_lon=0.0,
+        rtk_alt=0.0,
+        rtk_qua=0,
+        mag=0.0,
+        unix_ts=1234567890.0,
+        odom_x=0.0,
+        odom_y=0.0,
+        odom_rockchip_ts=0.0,
+        odom_subscriber_ts=0.0,
+        odom_yaw_0_360=0.0,
+        odom_yaw_m180_p180=0.0,
+        rf_data=[],
+        rf_data_raw=[],
+    )
+
+    def _make(**overrides):
+        return FabricData(**{**defaults, **overrides})
+
+    return _make
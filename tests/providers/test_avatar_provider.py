@@ -1,8 +1,16 @@
+import queue
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from providers.avatar_provider import AvatarProvider
+from zenoh_msgs import (
+    AvatarFaceRequest,
+    AvatarFaceResponse,
+    String,
+    prepare_header,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -123,6 +131,58 @@ def test_send_avatar_command_no_publisher(mock_zenoh):
     assert result is False
 
 
+def test_handle_avatar_request_publishes_response(mock_zenoh):
+    """A STATUS request is answered with an ACTIVE response off-thread."""
+    (
+        mock_session,
+        mock_session_instance,
+        mock_publisher,
+        mock_healthcheck_publisher,
+        mock_subscriber,
+    ) = mock_zenoh
+    provider = AvatarProvider()
+
+    published = threading.Event()
+    mock_healthcheck_publisher.put.side_effect = lambda *a, **k: published.set()
+
+    request = AvatarFaceRequest(
+        header=prepare_header("req-1"),
+        request_id=String("req-1"),
+        code=AvatarFaceRequest.Code.STATUS.value,
+        face_text=String(""),
+    )
+    sample = MagicMock()
+    sample.payload.to_bytes.return_value = request.serialize()
+
+    provider._handle_avatar_request(sample)
+
+    assert published.wait(1.0)
+    payload = mock_healthcheck_publisher.put.call_args[0][0]
+    response = AvatarFaceResponse.deserialize(payload)
+    assert response.code == AvatarFaceResponse.Code.ACTIVE.value
+    assert response.request_id.data == "req-1"
+
+
+def test_enqueue_response_drops_oldest_when_full(mock_zenoh):
+    """When the tx queue is full, the oldest pending reply is dropped."""
+    provider = AvatarProvider()
+
+    # Park the worker so enqueued replies stay in the queue
+    provider._tx_queue.put(None)
+    provider._tx_thread.join(timeout=1.0)
+    assert not provider._tx_thread.is_alive()
+
+    provider._tx_queue = queue.Queue(maxsize=2)
+    provider._enqueue_response(String("a"))
+    provider._enqueue_response(String("b"))
+    provider._enqueue_response(String("c"))
+
+    queued = [provider._tx_queue.get_nowait().data for _ in range(2)]
+    assert queued == ["b", "c"]
+    with pytest.raises(queue.Empty):
+        provider._tx_queue.get_nowait()
+
+
 def test_stop(mock_zenoh):
     (
         mock_session,
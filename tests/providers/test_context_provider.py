@@ -1,14 +1,31 @@
-import json
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
+import zenoh
 
 from providers.context_provider import ContextProvider
 
 
+@pytest.fixture(scope="module")
+def mock_zenoh():
+    """Patch the Zenoh session once per module; call history is cleared per test."""
+    with patch("providers.context_provider.open_zenoh_session") as mock_session:
+        mock_session_instance = MagicMock()
+        mock_publisher = MagicMock()
+        mock_session_instance.declare_publisher.return_value = mock_publisher
+        mock_session.return_value = mock_session_instance
+        yield mock_session, mock_session_instance, mock_publisher
+
+
 @pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton instances between tests."""
+def reset_singleton(mock_zenoh):
+    """Reset singleton instances and mock call history between tests."""
+    mock_session, mock_session_instance, mock_publisher = mock_zenoh
+    mock_session.reset_mock()
+    mock_session_instance.reset_mock()
+    mock_publisher.reset_mock()
+
     ContextProvider.reset()  # type: ignore
     yield
 
@@ -21,16 +38,6 @@ def reset_singleton():
     ContextProvider.reset()  # type: ignore
 
 
-@pytest.fixture
-def mock_zenoh():
-    with patch("providers.context_provider.open_zenoh_session") as mock_session:
-        mock_session_instance = MagicMock()
-        mock_publisher = MagicMock()
-        mock_session_instance.declare_publisher.return_value = mock_publisher
-        mock_session.return_value = mock_session_instance
-        yield mock_session, mock_session_instance, mock_publisher
-
-
 def test_initialization(mock_zenoh):
     _, mock_session_instance, mock_publisher = mock_zenoh
     provider = ContextProvider()
@@ -38,7 +45,11 @@ def test_initialization(mock_zenoh):
     assert provider.context_update_topic == "om/mode/context"
     assert provider.session == mock_session_instance
     assert provider.publisher == mock_publisher
-    mock_session_instance.declare_publisher.assert_called_once_with("om/mode/context")
+    mock_session_instance.declare_publisher.assert_called_once_with(
+        "om/mode/context",
+        express=True,
+        priority=zenoh.Priority.REAL_TIME,
+    )
 
 
 def test_singleton_pattern():
@@ -54,8 +65,7 @@ def test_update_context(mock_zenoh):
     context = {"location": "kitchen", "task": "cooking"}
     provider.update_context(context)
 
-    expected_json = json.dumps(context)
-    mock_publisher.put.assert_called_once_with(expected_json.encode("utf-8"))
+    mock_publisher.put.assert_called_once_with(orjson.dumps(context))
 
 
 def test_update_context_no_publisher(mock_zenoh):
@@ -75,8 +85,19 @@ def test_set_context_field(mock_zenoh):
 
     provider.set_context_field("battery_level", 75)
 
-    expected_json = json.dumps({"battery_level": 75})
-    mock_publisher.put.assert_called_once_with(expected_json.encode("utf-8"))
+    mock_publisher.put.assert_called_once_with(orjson.dumps({"battery_level": 75}))
+
+
+def test_set_context_field_accumulates(mock_zenoh):
+    _, _, mock_publisher = mock_zenoh
+    provider = ContextProvider()
+
+    provider.set_context_field("battery_level", 75)
+    provider.set_context_field("location", "kitchen")
+
+    mock_publisher.put.assert_called_with(
+        orjson.dumps({"battery_level": 75, "location": "kitchen"})
+    )
 
 
 def test_stop(mock_zenoh):
@@ -88,10 +109,12 @@ def test_stop(mock_zenoh):
     mock_session_instance.close.assert_called_once()
 
 
-def test_initialization_failure():
-    with patch("providers.context_provider.open_zenoh_session") as mock_session:
-        mock_session.side_effect = Exception("Connection failed")
-        provider = ContextProvider()
+def test_initialization_failure(monkeypatch):
+    def boom(*args, **kwargs):
+        raise Exception("Connection failed")
+
+    monkeypatch.setattr("providers.context_provider.open_zenoh_session", boom)
+    provider = ContextProvider()
 
-        assert provider.session is None
-        assert provider.publisher is None
+    assert provider.session is None
+    assert provider.publisher is None
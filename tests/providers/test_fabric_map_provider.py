@@ -1,32 +1,45 @@
+import json
 import os
 import tempfile
-import time
+import threading
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from providers.fabric_map_provider import (
-    FabricData,
+    RF_DATA_RAW_DTYPE,
     FabricDataSubmitter,
     RFData,
     RFDataRaw,
+    rf_data_raw_to_array,
 )
 
 
+@pytest.fixture(scope="module")
+def mock_httpx():
+    """Patch the httpx module once per module; call history is cleared per test."""
+    with patch("providers.fabric_map_provider.httpx") as mock_mod:
+        yield mock_mod
+
+
+@pytest.fixture(scope="module")
+def mock_client(mock_httpx):
+    """The HTTP/2 client instance the provider posts through."""
+    return mock_httpx.Client.return_value
+
+
 @pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton instances between tests."""
+def reset_singleton(mock_httpx):
+    """Reset singleton instances and mock call history between tests."""
+    # side_effect=True clears per-test side effects; return values are left
+    # alone so the module-scoped Client.return_value keeps its identity
+    mock_httpx.reset_mock(side_effect=True)
     FabricDataSubmitter.reset()  # type: ignore
     yield
     FabricDataSubmitter.reset()  # type: ignore
 
 
-@pytest.fixture
-def mock_requests():
-    with patch("providers.fabric_map_provider.requests") as mock_req:
-        yield mock_req
-
-
 def test_rf_data_to_dict():
     rf_data = RFData(
         unix_ts=1234567890.0,
@@ -83,84 +96,38 @@ def test_fabric_url():
     assert "test.endpoint" in provider.base_url
 
 
-def test_share_data(mock_requests):
+def test_share_data(mock_client, make_fabric_data):
     """Test sharing fabric data with an API key."""
     mock_response = MagicMock()
     mock_response.status_code = 201
-    mock_requests.post.return_value = mock_response
+    posted = threading.Event()
+    mock_client.post.side_effect = lambda *a, **k: (posted.set(), mock_response)[1]
 
     provider = FabricDataSubmitter(api_key="test_key")
 
-    fabric_data = FabricData(
-        machine_id="test_machine",
-        payload_idx=1,
-        gps_unix_ts=1234567890.0,
-        gps_lat=37.7749,
-        gps_lon=-122.4194,
-        gps_alt=10.0,
-        gps_qua=2,
-        rtk_unix_ts=0.0,
-        rtk_lat=0.0,
-        rtk_lon=0.0,
-        rtk_alt=0.0,
-        rtk_qua=0,
-        mag=0.0,
-        unix_ts=1234567890.0,
-        odom_x=0.0,
-        odom_y=0.0,
-        odom_rockchip_ts=0.0,
-        odom_subscriber_ts=0.0,
-        odom_yaw_0_360=0.0,
-        odom_yaw_m180_p180=0.0,
-        rf_data=[],
-        rf_data_raw=[],
-    )
-
-    provider.share_data(fabric_data)
-    time.sleep(0.1)
+    provider.share_data(make_fabric_data())
 
-    mock_requests.post.assert_called_once()
+    assert posted.wait(1.0)
+    mock_client.post.assert_called_once()
 
 
-def test_share_data_no_api_key(mock_requests):
+def test_share_data_no_api_key(mock_client, make_fabric_data):
     """Test sharing fabric data without an API key."""
     provider = FabricDataSubmitter()
 
-    fabric_data = FabricData(
-        machine_id="test_machine",
-        payload_idx=1,
-        gps_unix_ts=1234567890.0,
-        gps_lat=37.7749,
-        gps_lon=-122.4194,
-        gps_alt=10.0,
-        gps_qua=2,
-        rtk_unix_ts=0.0,
-        rtk_lat=0.0,
-        rtk_lon=0.0,
-        rtk_alt=0.0,
-        rtk_qua=0,
-        mag=0.0,
-        unix_ts=1234567890.0,
-        odom_x=0.0,
-        odom_y=0.0,
-        odom_rockchip_ts=0.0,
-        odom_subscriber_ts=0.0,
-        odom_yaw_0_360=0.0,
-        odom_yaw_m180_p180=0.0,
-        rf_data=[],
-        rf_data_raw=[],
-    )
-
-    provider.share_data(fabric_data)
-    time.sleep(0.1)
-    mock_requests.post.assert_not_called()
+    provider.share_data(make_fabric_data())
+    # Barrier: the single worker thread runs jobs FIFO, so once this
+    # sentinel completes the share job has finished
+    provider.executor.submit(lambda: None).result(timeout=1.0)
+    mock_client.post.assert_not_called()
 
 
-def test_share_data_with_rf_data(mock_requests):
+def test_share_data_with_rf_data(mock_client, make_fabric_data):
     """Test sharing fabric data including RF data."""
     mock_response = MagicMock()
     mock_response.status_code = 201
-    mock_requests.post.return_value = mock_response
+    posted = threading.Event()
+    mock_client.post.side_effect = lambda *a, **k: (posted.set(), mock_response)[1]
 
     provider = FabricDataSubmitter(api_key="test_key")
 
@@ -173,38 +140,96 @@ def test_share_data_with_rf_data(mock_requests):
         )
     ]
 
-    fabric_data = FabricData(
-        machine_id="test_machine",
-        payload_idx=1,
-        gps_unix_ts=1234567890.0,
-        gps_lat=37.7749,
-        gps_lon=-122.4194,
-        gps_alt=10.0,
-        gps_qua=2,
-        rtk_unix_ts=0.0,
-        rtk_lat=0.0,
-        rtk_lon=0.0,
-        rtk_alt=0.0,
-        rtk_qua=0,
-        mag=0.0,
-        unix_ts=1234567890.0,
-        odom_x=0.0,
-        odom_y=0.0,
-        odom_rockchip_ts=0.0,
-        odom_subscriber_ts=0.0,
-        odom_yaw_0_360=0.0,
-        odom_yaw_m180_p180=0.0,
-        rf_data=[],
-        rf_data_raw=ble_data,
+    provider.share_data(make_fabric_data(rf_data_raw=ble_data))
+
+    assert posted.wait(1.0)
+    mock_client.post.assert_called_once()
+
+
+def test_share_data_with_rf_data_np(mock_client, make_fabric_data):
+    """Test sharing fabric data with the packed structured-array RF path."""
+    mock_response = MagicMock()
+    mock_response.status_code = 201
+    posted = threading.Event()
+    mock_client.post.side_effect = lambda *a, **k: (posted.set(), mock_response)[1]
+
+    provider = FabricDataSubmitter(api_key="test_key")
+
+    ble_array = np.array(
+        [(1234567890.0, "AA:BB:CC:DD:EE:FF", -50, "packet1")],
+        dtype=RF_DATA_RAW_DTYPE,
     )
 
-    provider.share_data(fabric_data)
-    time.sleep(0.1)
+    provider.share_data(make_fabric_data(rf_data_raw_np=ble_array))
+
+    assert posted.wait(1.0)
+    payload = mock_client.post.call_args.kwargs["json"]
+    assert payload["rf_data_raw"] == [
+        {
+            "unix_ts": 1234567890.0,
+            "address": "AA:BB:CC:DD:EE:FF",
+            "rssi": -50,
+            "packet": "packet1",
+        }
+    ]
 
-    mock_requests.post.assert_called_once()
 
+def test_rf_data_raw_to_array_round_trip():
+    """Test packing RFDataRaw records into the structured array layout."""
+    records = [
+        RFDataRaw(
+            unix_ts=1234567890.0,
+            address="AA:BB:CC:DD:EE:FF",
+            rssi=-50,
+            packet="packet1",
+        )
+    ]
+
+    arr = rf_data_raw_to_array(records)
+
+    assert arr.dtype == RF_DATA_RAW_DTYPE
+    assert arr["address"][0] == "AA:BB:CC:DD:EE:FF"
+    assert arr["rssi"][0] == -50
+
+
+def test_share_data_batched(mock_client, make_fabric_data):
+    """Test that batched submission flushes N records with a single POST."""
+    mock_response = MagicMock()
+    mock_response.status_code = 201
+    posted = threading.Event()
+    mock_client.post.side_effect = lambda *a, **k: (posted.set(), mock_response)[1]
+
+    provider = FabricDataSubmitter(api_key="test_key", put_batch_size=50)
+
+    for _ in range(50):
+        provider.share_data(make_fabric_data())
 
-def test_write_to_local_file(mock_requests):
+    assert posted.wait(1.0)
+    mock_client.post.assert_called_once()
+    payload = mock_client.post.call_args.kwargs["json"]
+    assert len(payload) == 50
+
+
+def test_stop_drains_partial_batch(mock_client, make_fabric_data):
+    """Test that stop() flushes a partial batch instead of dropping it."""
+    mock_response = MagicMock()
+    mock_response.status_code = 201
+    posted = threading.Event()
+    mock_client.post.side_effect = lambda *a, **k: (posted.set(), mock_response)[1]
+
+    provider = FabricDataSubmitter(api_key="test_key", put_batch_size=50)
+
+    for _ in range(3):
+        provider.share_data(make_fabric_data())
+    provider.stop()
+
+    assert posted.wait(1.0)
+    mock_client.post.assert_called_once()
+    payload = mock_client.post.call_args.kwargs["json"]
+    assert len(payload) == 3
+
+
+def test_write_to_local_file(mock_client, make_fabric_data):
     """Test writing fabric data to a local file."""
     with tempfile.TemporaryDirectory() as tmpdir:
         provider = FabricDataSubmitter(api_key="test_key", write_to_local_file=True)
@@ -212,36 +237,22 @@ def test_write_to_local_file(mock_requests):
         provider.filename_base = os.path.join(tmpdir, "fabric")
         provider.filename_current = provider.update_filename()
 
-        fabric_data = FabricData(
-            machine_id="test_machine",
-            payload_idx=1,
-            gps_unix_ts=1234567890.0,
-            gps_lat=37.7749,
-            gps_lon=-122.4194,
-            gps_alt=10.0,
-            gps_qua=2,
-            rtk_unix_ts=0.0,
-            rtk_lat=0.0,
-            rtk_lon=0.0,
-            rtk_alt=0.0,
-            rtk_qua=0,
-            mag=0.0,
-            unix_ts=1234567890.0,
-            odom_x=0.0,
-            odom_y=0.0,
-            odom_rockchip_ts=0.0,
-            odom_subscriber_ts=0.0,
-            odom_yaw_0_360=0.0,
-            odom_yaw_m180_p180=0.0,
-            rf_data=[],
-            rf_data_raw=[],
-        )
-
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_requests.post.return_value = mock_response
+        mock_client.post.return_value = mock_response
 
-        provider.share_data(fabric_data)
-        time.sleep(0.1)
+        provider.share_data(make_fabric_data())
+        # Executor barrier + flush make the write visible deterministically,
+        # with no fixed sleep and no filesystem polling
+        provider.executor.submit(lambda: None).result(timeout=1.0)
+        provider.flush()
 
         assert os.path.exists(provider.filename_current)
+        with open(provider.filename_current, "rb") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["machine_id"] == "test_machine"
+
+        # stop() flushes and releases the long-lived handle
+        provider.stop()
+        assert provider._fh is None
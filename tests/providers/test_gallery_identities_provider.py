@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, Mock
 
+import orjson
 import pytest
 
 from providers.gallery_identities_provider import (
@@ -113,15 +114,27 @@ def test_unregister_callback():
     assert callback not in provider._callbacks
 
 
+def test_session_pool_configured():
+    """Test that the session mounts a pooled adapter for both schemes."""
+    provider = GalleryIdentitiesProvider()
+
+    for url in ("http://x", "https://x"):
+        adapter = provider._session.get_adapter(url)
+        assert adapter._pool_maxsize >= 8
+        assert adapter.max_retries.total == 2
+
+
 def test_fetch_identities_success():
     """Test successful fetch of identities."""
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "ok": True,
-        "total": 2,
-        "identities": [{"id": "Alice"}, {"id": "Bob"}],
-    }
+    mock_response.content = orjson.dumps(
+        {
+            "ok": True,
+            "total": 2,
+            "identities": [{"id": "Alice"}, {"id": "Bob"}],
+        }
+    )
 
     provider = GalleryIdentitiesProvider()
     provider._session.post = MagicMock(return_value=mock_response)
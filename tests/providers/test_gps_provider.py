@@ -6,22 +6,27 @@ import serial
 from providers.gps_provider import GpsProvider
 
 
-@pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton instances between tests."""
-    GpsProvider.reset()  # type: ignore
-    yield
-    GpsProvider.reset()  # type: ignore
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_serial():
+    """Patch serial.Serial once per module; call history is cleared per test."""
     with patch("providers.gps_provider.serial.Serial") as mock_serial_class:
         mock_serial_instance = MagicMock()
         mock_serial_class.return_value = mock_serial_instance
         yield mock_serial_class, mock_serial_instance
 
 
+@pytest.fixture(autouse=True)
+def reset_singleton(mock_serial):
+    """Reset singleton instances and mock call history between tests."""
+    mock_serial_class, mock_serial_instance = mock_serial
+    mock_serial_class.reset_mock()
+    mock_serial_instance.reset_mock()
+
+    GpsProvider.reset()  # type: ignore
+    yield
+    GpsProvider.reset()  # type: ignore
+
+
 def test_initialization(mock_serial):
     """Test GpsProvider initialization."""
     mock_serial_class, mock_serial_instance = mock_serial
@@ -46,14 +51,17 @@ def test_singleton_pattern(mock_serial):
     assert provider1 is provider2
 
 
-def test_serial_exception_handling():
+def test_serial_exception_handling(monkeypatch):
     """Test handling of serial.SerialException during initialization."""
-    with patch("providers.gps_provider.serial.Serial") as mock_serial_class:
-        mock_serial_class.side_effect = serial.SerialException("Port not found")
 
-        provider = GpsProvider("/dev/invalid")
+    def boom(*args, **kwargs):
+        raise serial.SerialException("Port not found")
+
+    monkeypatch.setattr("providers.gps_provider.serial.Serial", boom)
 
-        assert provider.serial_connection is None
+    provider = GpsProvider("/dev/invalid")
+
+    assert provider.serial_connection is None
 
 
 def test_string_to_unix_timestamp(mock_serial):
@@ -67,6 +75,26 @@ def test_string_to_unix_timestamp(mock_serial):
     assert timestamp > 0
 
 
+@pytest.mark.parametrize(
+    "time_str,expected",
+    [
+        # Epoch
+        ("1970:01:01:00:00:00:000", 0.0),
+        # Known value with milliseconds
+        ("2024:01:15:10:30:45:500", 1705314645.5),
+        # Leap day
+        ("2024:02:29:23:59:59:999", 1709251199.999),
+        # End of year rollover boundary
+        ("2023:12:31:23:59:59:000", 1704067199.0),
+    ],
+)
+def test_string_to_unix_timestamp_values(mock_serial, time_str, expected):
+    """Test exact timestamp values including epoch, leap day, and year end."""
+    provider = GpsProvider("/dev/ttyUSB0")
+
+    assert provider.string_to_unix_timestamp(time_str) == pytest.approx(expected)
+
+
 def test_stop(mock_serial):
     """Test stopping the GpsProvider."""
     provider = GpsProvider("/dev/ttyUSB0")